@@ -257,7 +257,9 @@ class SingleTableGPTModel(LLMBaseModel):
             self._metadata = Metadata.from_dataframe(train_data)
         # here we got both raw_data and metadata
         sample_lines = []
-        for _, row in train_data.iterrows():
+        # itertuples avoids building a boxed Series for every row like iterrows does
+        for values in train_data[self.columns].itertuples(index=False, name=None):
+            row = dict(zip(self.columns, values))
             each_line = ""
             shuffled_columns = copy(self.columns)
             random.shuffle(shuffled_columns)
@@ -198,6 +198,21 @@ def test_feature_extraction_data(
     single_table_gpt_model.check()
 
 
+def test_fit_with_data_sample_lines(single_table_gpt_model: SingleTableGPTModel):
+    raw_data = pd.DataFrame({"age": [39, 50], "score": [1.5, 2.0]})
+    single_table_gpt_model.fit(raw_data)
+
+    sample_lines = single_table_gpt_model._sample_lines
+    assert len(sample_lines) == len(raw_data)
+    # integer cells keep their format in all-numeric data, columns are shuffled in each line
+    for line, expected in zip(
+        sample_lines,
+        [["age is 39", "score is 1.5"], ["age is 50", "score is 2.0"]],
+    ):
+        assert line.endswith("\n")
+        assert sorted(line.strip().split(", ")) == expected
+
+
 @pytest.mark.parametrize("response_index", range(len(gpt_response_list)))
 def test_feature_extraction_metadata(
     response_index: int,
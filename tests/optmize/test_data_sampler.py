@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from sdgx.models.components.optimize.ndarray_loader import NDArrayLoader
+from sdgx.models.components.optimize.sdv_ctgan.data_sampler import DataSampler
+from sdgx.models.components.optimize.sdv_ctgan.data_transformer import SpanInfo
+from sdgx.models.components.sdv_ctgan.data_sampler import DataSampler as SDVDataSampler
+
+
+@pytest.fixture
+def output_info():
+    """
+    One continuous column, a discrete column with an empty category and another discrete column.
+    """
+    yield [
+        [SpanInfo(1, "tanh"), SpanInfo(2, "softmax")],
+        [SpanInfo(3, "softmax")],
+        [SpanInfo(2, "softmax")],
+    ]
+
+
+@pytest.fixture
+def ndarray():
+    rng = np.random.default_rng(42)
+    n = 50
+    data = np.zeros((n, 8))
+    data[:, 0] = rng.uniform(-1, 1, n)
+    data[np.arange(n), 1 + rng.integers(0, 2, n)] = 1
+    # Category 1 of the first discrete column never appears
+    data[np.arange(n), 3 + 2 * rng.integers(0, 2, n)] = 1
+    data[np.arange(n), 6 + rng.integers(0, 2, n)] = 1
+    yield data
+
+
+@pytest.fixture
+def ndarray_loader(tmp_path, ndarray):
+    loader = NDArrayLoader(cache_root=tmp_path / "ndarrycache")
+    loader.store(ndarray)
+    yield loader
+    loader.cleanup()
+
+
+def _expected_rid_by_cat_cols(ndarray):
+    # Row ids computed column by column, one np.nonzero per category
+    return [[np.nonzero(ndarray[:, st + j])[0] for j in range(dim)] for st, dim in ((3, 3), (6, 2))]
+
+
+def _assert_rid_by_cat_cols(rid_by_cat_cols, expected):
+    assert len(rid_by_cat_cols) == len(expected)
+    for rid_by_cat, expected_rid_by_cat in zip(rid_by_cat_cols, expected):
+        assert len(rid_by_cat) == len(expected_rid_by_cat)
+        for rid, expected_rid in zip(rid_by_cat, expected_rid_by_cat):
+            np.testing.assert_equal(rid, expected_rid)
+
+
+@pytest.mark.parametrize("use_loader", [False, True])
+def test_rid_by_cat_cols(use_loader, ndarray, ndarray_loader, output_info):
+    data = ndarray_loader if use_loader else ndarray
+    sampler = DataSampler(data, output_info, log_frequency=True)
+
+    expected = _expected_rid_by_cat_cols(ndarray)
+    assert expected[0][1].size == 0
+    _assert_rid_by_cat_cols(sampler._rid_by_cat_cols, expected)
+
+
+def test_sdv_rid_by_cat_cols(ndarray, output_info):
+    sampler = SDVDataSampler(ndarray, output_info, log_frequency=True)
+
+    _assert_rid_by_cat_cols(sampler._rid_by_cat_cols, _expected_rid_by_cat_cols(ndarray))